@@ -20,17 +20,74 @@ import time
 import json
 import os
 import sys
+import copy
+import ctypes
+import ctypes.util
+import select
+import signal
+import platform
 import threading
-import subprocess
 from pathlib import Path
 from ApplicationServices import (
     AXUIElementCreateSystemWide,
     AXUIElementCopyAttributeValue,
     AXIsProcessTrusted,
 )
+from AppKit import NSWorkspace
+
+# Batched attribute fetch (one Mach IPC round-trip for several attributes);
+# older PyObjC releases may not export it, so fall back to per-attribute calls.
+try:
+    from ApplicationServices import AXUIElementCopyMultipleAttributeValues
+except ImportError:
+    AXUIElementCopyMultipleAttributeValues = None
 from pynput import keyboard
 from pynput.keyboard import Key, KeyCode, Controller, HotKey, GlobalHotKeys
 
+# FSEvents gives us kernel-delivered notifications for the signal files so we
+# don't have to stat them in a loop. Optional: we fall back to polling if the
+# package isn't installed or we're not on macOS.
+try:
+    import fsevents  # macfsevents
+except ImportError:
+    fsevents = None
+
+# xxhash fingerprints text snapshots so change detection compares two ints
+# instead of memcmp-ing a potentially multi-KB prompt every update. Optional:
+# the builtin hash is a fine per-process fallback.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# AXObserver lets the Accessibility API push text-change notifications to us
+# instead of us polling AXValue ~7x/s. Needs the full ApplicationServices +
+# Cocoa PyObjC bindings; we fall back to the polling monitor without them.
+try:
+    from ApplicationServices import (
+        AXObserverCreate,
+        AXObserverAddNotification,
+        AXObserverRemoveNotification,
+        AXObserverGetRunLoopSource,
+        AXUIElementCreateApplication,
+        kAXValueChangedNotification,
+        kAXFocusedUIElementChangedNotification,
+    )
+    from CoreFoundation import (
+        CFRunLoopAddSource,
+        CFRunLoopRemoveSource,
+        CFRunLoopGetCurrent,
+        CFRunLoopRun,
+        CFRunLoopStop,
+        kCFRunLoopDefaultMode,
+    )
+    from AppKit import NSWorkspaceDidActivateApplicationNotification
+    from Foundation import NSOperationQueue
+    from PyObjCTools import AppHelper
+    HAVE_AX_OBSERVER = True
+except ImportError:
+    HAVE_AX_OBSERVER = False
+
 # Import our silence detector
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from silence_detector import wait_for_silence
@@ -41,6 +98,12 @@ CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'co
 SIGNAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'listen-signal.json')
 TTS_COMPLETE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tts-complete.json')
 
+USE_FSEVENTS = fsevents is not None and platform.system() == 'Darwin'
+
+# Parsed configs keyed on (path, mtime, size) so reloads are free while the
+# file is unchanged
+_config_cache = {}
+
 def load_config():
     defaults = {
         'autoSubmit': {
@@ -59,17 +122,29 @@ def load_config():
         }
     }
     try:
+        st = os.stat(CONFIG_PATH)
+        key = (CONFIG_PATH, st.st_mtime_ns, st.st_size)
+        cached = _config_cache.get(key)
+        if cached is not None:
+            # Deep copy so callers can't mutate the cached config
+            return copy.deepcopy(cached)
+
         with open(CONFIG_PATH, 'r') as f:
             config = json.load(f)
-            for key in defaults:
-                if key in config:
-                    for subkey in defaults[key]:
-                        if subkey in config[key]:
-                            defaults[key][subkey] = config[key][subkey]
+            for key_name in defaults:
+                if key_name in config:
+                    for subkey in defaults[key_name]:
+                        if subkey in config[key_name]:
+                            defaults[key_name][subkey] = config[key_name][subkey]
+
+        _config_cache.clear()
+        _config_cache[key] = copy.deepcopy(defaults)
     except (FileNotFoundError, json.JSONDecodeError):
         pass
     return defaults
 
+load_config.cache_clear = _config_cache.clear
+
 config = load_config()
 
 AUTO_SUBMIT_ENABLED = config['autoSubmit']['enabled']
@@ -86,10 +161,13 @@ MANUAL_TRIGGER_HOTKEY = config['wisprLoop']['manualTriggerHotkey']
 
 # ─── State ───────────────────────────────────────────────────────────────────
 
-# Auto-submit state
-last_text = None
+# Auto-submit state. Snapshots of the focused field are tracked as
+# (length, fingerprint) pairs rather than full strings, so comparing against
+# the previous snapshot is two int compares instead of a full memcmp.
+last_len = None
+last_hash = None
 last_change_time = 0.0
-text_at_change_start = None
+baseline_len = None
 submit_timer = None
 monitoring = True
 
@@ -99,53 +177,115 @@ ctrl = Controller()
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
 def get_frontmost_app():
-    """Get the name of the currently focused application."""
+    """Get the name of the currently focused application.
+
+    Uses NSWorkspace in-process — a single Objective-C call instead of
+    spawning osascript (fork/exec + AppleEvents) per lookup. NSWorkspace's
+    running-application state is refreshed by the main run loop, which
+    main() keeps pumping; if that ever changes, this lookup (and with it
+    the frontmost gate and do_submit's target check) can go stale.
+    """
     try:
-        result = subprocess.run(
-            ['osascript', '-e',
-             'tell application "System Events" to get name of first application process whose frontmost is true'],
-            capture_output=True, text=True, timeout=2
-        )
-        return result.stdout.strip()
+        app = NSWorkspace.sharedWorkspace().frontmostApplication()
+        if app is None:
+            return ""
+        return str(app.localizedName() or "")
     except Exception:
         return ""
 
-def get_focused_text():
-    """Get the text content of the currently focused UI element via Accessibility API."""
+# Last frontmost-app lookup as (monotonic timestamp, name); refreshed at most
+# every 500ms so hot loops can gate on it cheaply
+_app_cache = (0.0, "")
+
+def get_frontmost_app_cached(max_age=0.5):
+    """Get the frontmost app name, cached for up to max_age seconds."""
+    global _app_cache
+    now = time.monotonic()
+    if now - _app_cache[0] > max_age:
+        _app_cache = (now, get_frontmost_app())
+    return _app_cache[1]
+
+# The system-wide accessibility element is process-constant; create it once
+# instead of allocating a fresh CFType on every lookup
+_SYSTEM_WIDE = AXUIElementCreateSystemWide()
+
+def _get_focused_element():
+    """Get the currently focused UI element via the Accessibility API."""
     try:
-        system_wide = AXUIElementCreateSystemWide()
         err, focused = AXUIElementCopyAttributeValue(
-            system_wide, "AXFocusedUIElement", None
+            _SYSTEM_WIDE, "AXFocusedUIElement", None
         )
         if err != 0 or focused is None:
             return None
-        
-        err, value = AXUIElementCopyAttributeValue(focused, "AXValue", None)
+        return focused
+    except Exception:
+        return None
+
+def _get_element_length(element):
+    """Get the character count of an element — a cheap int probe that avoids
+    copying the full text buffer across the process boundary."""
+    try:
+        err, value = AXUIElementCopyAttributeValue(
+            element, "AXNumberOfCharacters", None
+        )
+        if err != 0 or value is None:
+            return None
+        return int(value)
+    except Exception:
+        return None
+
+def _get_element_text(element):
+    """Get the text content of a UI element."""
+    try:
+        if AXUIElementCopyMultipleAttributeValues is not None:
+            # One IPC round-trip for both attributes instead of one each
+            err, values = AXUIElementCopyMultipleAttributeValues(
+                element, ["AXValue", "AXNumberOfCharacters"], 0, None
+            )
+            if err == 0 and values and isinstance(values[0], str):
+                return str(values[0])
+            return None
+
+        err, value = AXUIElementCopyAttributeValue(element, "AXValue", None)
         if err != 0 or value is None:
             return None
-        
         return str(value)
     except Exception:
         return None
 
+def get_focused_text():
+    """Get the text content of the currently focused UI element via Accessibility API."""
+    focused = _get_focused_element()
+    if focused is None:
+        return None
+    return _get_element_text(focused)
+
+# Modifier-token tables shared by parse_hotkey and setup_manual_trigger;
+# aliases canonicalize to the names pynput knows.
+_KEY_ALIASES = {'control': 'ctrl', 'option': 'alt', 'command': 'cmd'}
+_KEY_MAP = {
+    'shift': Key.shift,
+    'ctrl': Key.ctrl,
+    'alt': Key.alt,
+    'cmd': Key.cmd,
+}
+
 def parse_hotkey(hotkey_str):
     """Parse a hotkey string like 'shift+ctrl' into Key objects."""
-    parts = hotkey_str.lower().split('+')
     keys = []
-    for part in parts:
+    for part in hotkey_str.lower().split('+'):
         part = part.strip()
-        if part == 'shift':
-            keys.append(Key.shift)
-        elif part == 'ctrl' or part == 'control':
-            keys.append(Key.ctrl)
-        elif part == 'alt' or part == 'option':
-            keys.append(Key.alt)
-        elif part == 'cmd' or part == 'command':
-            keys.append(Key.cmd)
+        part = _KEY_ALIASES.get(part, part)
+        if part in _KEY_MAP:
+            keys.append(_KEY_MAP[part])
         elif len(part) == 1:
             keys.append(KeyCode.from_char(part))
     return keys
 
+# The Wispr hotkey comes from config and never changes at runtime, so parse
+# it once instead of on every trigger
+_WISPR_KEYS = parse_hotkey(WISPR_HOTKEY)
+
 def press_hotkey(keys):
     """Press and release a hotkey combination."""
     # Press all keys
@@ -156,29 +296,84 @@ def press_hotkey(keys):
     for key in reversed(keys):
         ctrl.release(key)
 
+def _wait_for_dir_change(path, timeout):
+    """Block until path's parent directory changes, or timeout expires.
+
+    On BSD/macOS, arms a kqueue EVFILT_VNODE watch on the parent directory so
+    the thread sleeps in the kernel instead of stat-polling. kqueue signals
+    the directory, not the file, so callers re-check whatever condition they
+    care about after each wakeup. Falls back to a short sleep where kqueue is
+    unavailable.
+    """
+    if timeout <= 0:
+        return
+
+    if not hasattr(select, 'kqueue'):
+        time.sleep(min(0.1, timeout))
+        return
+
+    kq = select.kqueue()
+    fd = os.open(os.path.dirname(path) or '.',
+                 os.O_RDONLY | getattr(os, 'O_EVTONLY', 0))
+    try:
+        kev = select.kevent(fd,
+                            filter=select.KQ_FILTER_VNODE,
+                            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                            fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND)
+        kq.control([kev], 1, timeout)
+    finally:
+        os.close(fd)
+        kq.close()
+
+def _read_tts_seq():
+    """Read the seq token from tts-complete.json, or None if unreadable."""
+    try:
+        with open(TTS_COMPLETE_PATH, 'r') as f:
+            data = json.load(f)
+        # Valid JSON isn't necessarily an object (`null`, a list, a bare
+        # number all parse) — treat anything but a dict as unreadable
+        if not isinstance(data, dict):
+            return None
+        return int(data.get('seq', 0))
+    except (OSError, json.JSONDecodeError, ValueError, TypeError):
+        return None
+
+# Seq token of the last completion signal we consumed. The MCP server writes
+# a fresh token (via atomic rename) after each playback, so comparing tokens
+# replaces the old check-then-delete dance and its TOCTOU race. Anything on
+# disk at startup is stale by definition.
+_last_tts_seq = _read_tts_seq() or 0
+
 def wait_for_tts_completion(timeout=15.0):
-    """Wait for the TTS completion signal file with timeout."""
+    """Wait for a fresh TTS completion signal, with timeout."""
+    global _last_tts_seq
     print(f"[wispr-loop] Waiting for TTS to complete...")
-    start_time = time.time()
-    
-    # Clear any stale completion signal first
-    if os.path.exists(TTS_COMPLETE_PATH):
-        try:
-            os.remove(TTS_COMPLETE_PATH)
-        except:
-            pass
-    
-    while (time.time() - start_time) < timeout:
-        if os.path.exists(TTS_COMPLETE_PATH):
+    # Monotonic deadline: immune to wall-clock steps (NTP) mid-wait
+    deadline = time.monotonic() + timeout
+
+    _tts_complete_event.clear()
+
+    while True:
+        seq = _read_tts_seq()
+        if seq is not None and seq > _last_tts_seq:
+            _last_tts_seq = seq
             print(f"[wispr-loop] TTS completion signal received!")
-            # Delete the completion signal
-            try:
-                os.remove(TTS_COMPLETE_PATH)
-            except:
-                pass
             return True
-        time.sleep(0.1)  # Poll every 100ms
-    
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if _fsevents_observer is not None:
+            # Block until FSEvents reports a change in the signal directory
+            _tts_complete_event.wait(remaining)
+            _tts_complete_event.clear()
+        else:
+            # Sleep in the kernel until the signal directory changes. The
+            # watch is armed after the seq read above, so a rename landing
+            # in between produces no event; capping each slice at 1s bounds
+            # what such a lost wakeup can cost before the seq is re-checked.
+            _wait_for_dir_change(TTS_COMPLETE_PATH, min(remaining, 1.0))
+
     # Timeout - proceed anyway with a warning
     print(f"[wispr-loop] Warning: TTS completion timeout after {timeout}s, proceeding anyway...")
     return False
@@ -186,10 +381,9 @@ def wait_for_tts_completion(timeout=15.0):
 def trigger_wispr_loop():
     """Execute the Wispr voice loop: start Wispr, wait for silence, stop Wispr."""
     print(f"[wispr-loop] Starting Wispr voice loop...")
-    
-    # Parse Wispr hotkey
-    wispr_keys = parse_hotkey(WISPR_HOTKEY)
-    
+
+    wispr_keys = _WISPR_KEYS
+
     # Trigger Wispr to start recording
     print(f"[wispr-loop] Pressing {WISPR_HOTKEY} to start Wispr recording...")
     press_hotkey(wispr_keys)
@@ -233,100 +427,531 @@ def do_submit(new_text_length):
     time.sleep(0.5)
     monitoring = True
 
+def _hash_text(text):
+    """Fingerprint a text snapshot for cheap change comparison."""
+    if xxhash is not None:
+        return xxhash.xxh64_intdigest(text.encode('utf-8', 'ignore'))
+    return hash(text)
+
+def handle_text_snapshot(current_text):
+    """Process a snapshot of the focused field's text and schedule a submit.
+
+    Shared by the polling monitor and the AXObserver callback.
+    """
+    global last_len, last_hash, last_change_time, baseline_len, submit_timer
+
+    # Detect text change via the (length, fingerprint) pair
+    length = len(current_text)
+    fingerprint = _hash_text(current_text)
+    if length == last_len and fingerprint == last_hash:
+        return
+
+    now = time.time()
+
+    # If this is the start of a new burst of changes, record the baseline
+    if baseline_len is None:
+        baseline_len = last_len or 0
+
+    new_chars = length - baseline_len
+
+    last_len = length
+    last_hash = fingerprint
+    last_change_time = now
+
+    # Cancel any pending submit
+    if submit_timer is not None:
+        submit_timer.cancel()
+
+    # Only schedule submit if meaningful text was added
+    if new_chars >= MIN_TEXT_LENGTH:
+        submit_timer = threading.Timer(SILENCE_DELAY, do_submit, args=[new_chars])
+        submit_timer.daemon = True
+        submit_timer.start()
+
 def monitor_text_field():
-    """Poll the focused text field for changes (auto-submit monitor)."""
-    global last_text, last_change_time, text_at_change_start, submit_timer, monitoring
-    
+    """Poll the focused text field for changes (auto-submit fallback monitor)."""
     while True:
         if not AUTO_SUBMIT_ENABLED or not monitoring:
             time.sleep(0.2)
             continue
-            
+
+        # Don't pay for the Accessibility round-trips unless the target app
+        # is actually frontmost
+        if get_frontmost_app_cached() != TARGET_APP:
+            time.sleep(0.5)
+            continue
+
+        _poll_text_tick()
+        time.sleep(0.15)  # Poll ~7 times per second
+
+def _poll_text_tick():
+    """One iteration of the polling monitor; also driven by the reactor timer."""
+    if not AUTO_SUBMIT_ENABLED or not monitoring:
+        return
+
+    # Don't pay for the Accessibility round-trips unless the target app
+    # is actually frontmost
+    if get_frontmost_app_cached() != TARGET_APP:
+        return
+
+    try:
+        focused = _get_focused_element()
+
+        if focused is None:
+            return
+
+        # Probe the cheap character count first; only copy the full text
+        # buffer over IPC when the length actually changed
+        length = _get_element_length(focused)
+        if length is not None and length == last_len:
+            return
+
+        current_text = _get_element_text(focused)
+
+        if current_text is None:
+            return
+
+        handle_text_snapshot(current_text)
+
+    except Exception:
+        pass
+
+# ─── AXObserver Text Monitor ────────────────────────────────────────────────
+
+# CFRunLoop of the observer thread; the app-activation block stops it so the
+# observer loop can re-subscribe to the newly frontmost app.
+_ax_runloop = None
+
+# Queue the workspace notification block is delivered on. An explicit queue
+# makes delivery independent of any run loop in this process; with a nil
+# queue the block would run on the posting thread, which nothing here pumps.
+_ax_notify_queue = None
+
+def _ax_notification_callback(observer, element, notification, refcon):
+    """AXObserver callback: the focused field's value (or focus) changed."""
+    if not AUTO_SUBMIT_ENABLED or not monitoring:
+        return
+    try:
+        current_text = get_focused_text()
+        if current_text is not None:
+            handle_text_snapshot(current_text)
+    except Exception:
+        pass
+
+def _ax_observer_loop(started):
+    """Observe text changes in the frontmost app, re-subscribing on app switch.
+
+    Runs a CFRunLoop on this thread; an NSWorkspace app-activation observer
+    flags the switch and stops the run loop whenever the frontmost app
+    changes, and the outer loop re-creates the AXObserver against the new
+    app's PID.
+    """
+    global _ax_runloop, _ax_notify_queue
+    _ax_runloop = CFRunLoopGetCurrent()
+
+    # Flag a frontmost-app switch and stop our run loop so we re-subscribe.
+    # CFRunLoopStop alone isn't enough: it is a no-op while the loop isn't
+    # running, so an activation landing between CFRunLoopRun calls would be
+    # silently dropped. The flag survives that gap and is checked before
+    # each blocking run. The block runs on its own NSOperationQueue
+    # (CFRunLoopStop is safe to call cross-thread), so delivery doesn't
+    # depend on the posting thread having a serviced run loop.
+    switch_pending = threading.Event()
+
+    def _on_app_activated(note):
+        switch_pending.set()
+        CFRunLoopStop(_ax_runloop)
+
+    _ax_notify_queue = NSOperationQueue.alloc().init()
+    center = NSWorkspace.sharedWorkspace().notificationCenter()
+    center.addObserverForName_object_queue_usingBlock_(
+        NSWorkspaceDidActivateApplicationNotification, None, _ax_notify_queue,
+        _on_app_activated
+    )
+
+    while True:
+        observer = None
+        app_element = None
+        source = None
         try:
-            current_text = get_focused_text()
-            
-            if current_text is None:
-                time.sleep(0.15)
+            # Cleared before reading the frontmost app: a switch arriving
+            # after this point re-sets the flag and is caught below
+            switch_pending.clear()
+            app = NSWorkspace.sharedWorkspace().frontmostApplication()
+            if app is None:
+                time.sleep(0.5)
                 continue
-            
-            # Detect text change
-            if current_text != last_text:
-                now = time.time()
-                
-                # If this is the start of a new burst of changes, record the baseline
-                if text_at_change_start is None:
-                    text_at_change_start = last_text or ""
-                
-                new_chars = len(current_text) - len(text_at_change_start)
-                
-                last_text = current_text
-                last_change_time = now
-                
-                # Cancel any pending submit
-                if submit_timer is not None:
-                    submit_timer.cancel()
-                
-                # Only schedule submit if meaningful text was added
-                if new_chars >= MIN_TEXT_LENGTH:
-                    submit_timer = threading.Timer(SILENCE_DELAY, do_submit, args=[new_chars])
-                    submit_timer.daemon = True
-                    submit_timer.start()
-                
+            pid = app.processIdentifier()
+
+            err, observer = AXObserverCreate(pid, _ax_notification_callback, None)
+            if err != 0:
+                raise OSError(f"AXObserverCreate failed (error {err})")
+
+            app_element = AXUIElementCreateApplication(pid)
+            for notification in (kAXValueChangedNotification,
+                                 kAXFocusedUIElementChangedNotification):
+                err = AXObserverAddNotification(observer, app_element, notification, None)
+                if err != 0:
+                    raise OSError(f"AXObserverAddNotification failed (error {err})")
+
+            source = AXObserverGetRunLoopSource(observer)
+            CFRunLoopAddSource(_ax_runloop, source, kCFRunLoopDefaultMode)
+            started.set()
+
+            # A switch may have landed while we were subscribing, with no
+            # running loop for CFRunLoopStop to stop; re-check the frontmost
+            # PID and only block if we're still observing the right app
+            if not switch_pending.is_set():
+                front = NSWorkspace.sharedWorkspace().frontmostApplication()
+                if front is None or front.processIdentifier() == pid:
+                    # Blocks until the app-activation block calls CFRunLoopStop
+                    CFRunLoopRun()
         except Exception as e:
-            pass
-        
-        time.sleep(0.15)  # Poll ~7 times per second
+            if not started.is_set():
+                # First subscription failed: report back so main() can fall
+                # back to the polling monitor
+                return
+            print(f"[auto-submit] AXObserver error: {e}, retrying...")
+            time.sleep(0.5)
+        finally:
+            # Runs on the error path too, so partially subscribed observers
+            # and their sources don't pile up on the run loop across retries
+            if observer is not None and app_element is not None:
+                for notification in (kAXValueChangedNotification,
+                                     kAXFocusedUIElementChangedNotification):
+                    try:
+                        AXObserverRemoveNotification(observer, app_element, notification)
+                    except Exception:
+                        pass
+            if source is not None:
+                try:
+                    CFRunLoopRemoveSource(_ax_runloop, source, kCFRunLoopDefaultMode)
+                except Exception:
+                    pass
+
+def start_text_observer():
+    """Start the AXObserver monitor thread; returns False if unavailable."""
+    if not HAVE_AX_OBSERVER:
+        return False
+    started = threading.Event()
+    thread = threading.Thread(target=_ax_observer_loop, args=[started], daemon=True)
+    thread.start()
+    if not started.wait(timeout=2.0):
+        return False
+    return True
+
+# ─── Reactor ────────────────────────────────────────────────────────────────
+
+class Reactor:
+    """Single-threaded event loop over one kqueue.
+
+    Multiplexes kernel timers (EVFILT_TIMER), directory watches
+    (EVFILT_VNODE) and callbacks queued from other threads via call_soon
+    and a self-pipe, so the periodic work that used to occupy one sleeping
+    thread each now drains in a single worker thread with batched wakeups.
+    Only quick, non-blocking callbacks belong here; anything that blocks
+    (the Wispr loop, TTS waits) runs on its own worker thread. It must not
+    run on the main thread: that one pumps the CFRunLoop that AppKit and
+    Carbon event delivery depend on.
+    """
+
+    def __init__(self):
+        self._kq = select.kqueue()
+        self._handlers = {}       # (filter, ident) -> callback
+        self._changes = []
+        self._pending = []        # callbacks queued by call_soon
+        self._pending_lock = threading.Lock()
+        self._next_timer_ident = 1
+
+        self._rpipe, self._wpipe = os.pipe()
+        os.set_blocking(self._rpipe, False)
+        self._changes.append(select.kevent(
+            self._rpipe,
+            filter=select.KQ_FILTER_READ,
+            flags=select.KQ_EV_ADD))
+
+    def add_timer(self, interval_ms, callback):
+        """Fire callback every interval_ms on the reactor thread."""
+        ident = self._next_timer_ident
+        self._next_timer_ident += 1
+        self._handlers[(select.KQ_FILTER_TIMER, ident)] = callback
+        self._changes.append(select.kevent(
+            ident,
+            filter=select.KQ_FILTER_TIMER,
+            flags=select.KQ_EV_ADD,
+            data=interval_ms))
+
+    def watch_dir(self, path, callback):
+        """Fire callback whenever the directory at path changes."""
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_EVTONLY', 0))
+        self._handlers[(select.KQ_FILTER_VNODE, fd)] = callback
+        self._changes.append(select.kevent(
+            fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND))
+
+    def call_soon(self, callback):
+        """Queue callback to run on the reactor thread (thread-safe)."""
+        with self._pending_lock:
+            self._pending.append(callback)
+        os.write(self._wpipe, b'x')
+
+    def _run_callback(self, callback):
+        try:
+            callback()
+        except Exception as e:
+            print(f"[reactor] Callback error: {e}")
+
+    def run(self):
+        """Run the event loop forever."""
+        changes = self._changes
+        self._changes = []
+        while True:
+            events = self._kq.control(changes, 16, None)
+            changes = []
+            for ev in events:
+                if (ev.filter == select.KQ_FILTER_READ
+                        and ev.ident == self._rpipe):
+                    try:
+                        os.read(self._rpipe, 4096)
+                    except BlockingIOError:
+                        pass
+                    with self._pending_lock:
+                        pending, self._pending = self._pending, []
+                    for callback in pending:
+                        self._run_callback(callback)
+                else:
+                    callback = self._handlers.get((ev.filter, ev.ident))
+                    if callback is not None:
+                        self._run_callback(callback)
+
+# The running reactor, if main() started one. The only cross-thread producer
+# is the FSEvents signal callback, which hands the listen-signal check over
+# via call_soon; hotkey callbacks bypass the reactor and spawn their own
+# worker threads, because the Wispr loop they run blocks for seconds and
+# would starve the reactor's timers.
+_reactor = None
 
 # ─── Wispr Loop Signal Watcher ──────────────────────────────────────────────
 
+# Set by the FSEvents callback whenever the signal directory changes. FSEvents
+# reports the directory, not the individual file, so waiters re-check the
+# specific path they care about after each wakeup.
+_listen_signal_event = threading.Event()
+_tts_complete_event = threading.Event()
+_fsevents_observer = None
+
+def _on_signal_dir_change(event):
+    """FSEvents callback: wake up whichever waiter's file changed."""
+    changed = os.path.realpath(event.name)
+    if changed == os.path.realpath(SIGNAL_PATH):
+        if _reactor is not None:
+            _reactor.call_soon(_check_listen_signal)
+        else:
+            _listen_signal_event.set()
+    elif changed == os.path.realpath(TTS_COMPLETE_PATH):
+        _tts_complete_event.set()
+
+def start_signal_observer():
+    """Start an FSEvents stream on the signal directory (macOS only)."""
+    global _fsevents_observer
+    if not USE_FSEVENTS:
+        return False
+    try:
+        stream = fsevents.Stream(_on_signal_dir_change,
+                                 os.path.dirname(os.path.realpath(SIGNAL_PATH)),
+                                 file_events=True)
+        _fsevents_observer = fsevents.Observer()
+        _fsevents_observer.daemon = True
+        _fsevents_observer.start()
+        _fsevents_observer.schedule(stream)
+        return True
+    except Exception as e:
+        print(f"[wispr-loop] FSEvents unavailable ({e}), falling back to polling")
+        _fsevents_observer = None
+        return False
+
+def _wispr_after_tts():
+    """Wait out TTS playback, then run the Wispr loop (worker thread)."""
+    wait_for_tts_completion()
+    trigger_wispr_loop()
+
+def _check_listen_signal():
+    """Consume listen-signal.json if present and kick off the Wispr loop.
+
+    Non-blocking: the file is removed immediately (so repeated directory
+    events can't double-trigger) and the TTS wait + Wispr loop run on a
+    short-lived worker thread.
+    """
+    if not WISPR_LOOP_ENABLED:
+        return
+    try:
+        if not os.path.exists(SIGNAL_PATH):
+            return
+        print(f"[wispr-loop] Listen signal detected!")
+        os.remove(SIGNAL_PATH)
+        threading.Thread(target=_wispr_after_tts, daemon=True).start()
+    except Exception as e:
+        print(f"[wispr-loop] Error: {e}")
+
 def watch_for_signals():
-    """Watch for listen-signal.json and trigger Wispr loop when found."""
+    """Watch for listen-signal.json (fallback thread when no reactor runs)."""
+    event_driven = USE_FSEVENTS and _fsevents_observer is not None
+
     while True:
         if not WISPR_LOOP_ENABLED:
             time.sleep(0.5)
             continue
-        
-        try:
-            if os.path.exists(SIGNAL_PATH):
-                print(f"[wispr-loop] Listen signal detected!")
-                
-                # Delete the signal file
-                os.remove(SIGNAL_PATH)
-                
-                # Wait for TTS to actually finish playing
-                wait_for_tts_completion()
-                
-                # Start the Wispr loop in a separate thread so we don't block
-                threading.Thread(target=trigger_wispr_loop, daemon=True).start()
-        
-        except Exception as e:
-            print(f"[wispr-loop] Error: {e}")
-        
-        time.sleep(0.3)  # Poll for signal file every 300ms
+
+        _check_listen_signal()
+
+        if event_driven:
+            # Sleep until FSEvents reports a change in the signal directory
+            _listen_signal_event.wait()
+            _listen_signal_event.clear()
+        else:
+            time.sleep(0.3)  # Poll for signal file every 300ms
 
 # ─── Manual Trigger Hotkey ──────────────────────────────────────────────────
 
-def setup_manual_trigger():
-    """Register a global hotkey to manually trigger the Wispr loop."""
+# Carbon virtual keycodes for the US ANSI layout (HIToolbox Events.h)
+_CARBON_KEYCODES = {
+    'a': 0x00, 's': 0x01, 'd': 0x02, 'f': 0x03, 'h': 0x04, 'g': 0x05,
+    'z': 0x06, 'x': 0x07, 'c': 0x08, 'v': 0x09, 'b': 0x0B, 'q': 0x0C,
+    'w': 0x0D, 'e': 0x0E, 'r': 0x0F, 'y': 0x10, 't': 0x11,
+    '1': 0x12, '2': 0x13, '3': 0x14, '4': 0x15, '6': 0x16, '5': 0x17,
+    '=': 0x18, '9': 0x19, '7': 0x1A, '-': 0x1B, '8': 0x1C, '0': 0x1D,
+    ']': 0x1E, 'o': 0x1F, 'u': 0x20, '[': 0x21, 'i': 0x22, 'p': 0x23,
+    'l': 0x25, 'j': 0x26, "'": 0x27, 'k': 0x28, ';': 0x29, '\\': 0x2A,
+    ',': 0x2B, '/': 0x2C, 'n': 0x2D, 'm': 0x2E, '.': 0x2F,
+}
+
+# Carbon modifier masks (cmdKey / shiftKey / optionKey / controlKey)
+_CARBON_MODIFIERS = {'cmd': 0x0100, 'shift': 0x0200, 'alt': 0x0800, 'ctrl': 0x1000}
+
+_kEventClassKeyboard = int.from_bytes(b'keyb', 'big')
+_kEventHotKeyPressed = 5
+
+class _EventHotKeyID(ctypes.Structure):
+    _fields_ = [('signature', ctypes.c_uint32), ('id', ctypes.c_uint32)]
+
+class _EventTypeSpec(ctypes.Structure):
+    _fields_ = [('eventClass', ctypes.c_uint32), ('eventKind', ctypes.c_uint32)]
+
+# OSStatus (*)(EventHandlerCallRef, EventRef, void *)
+_EVENT_HANDLER_TYPE = ctypes.CFUNCTYPE(
+    ctypes.c_int32, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
+
+# ctypes objects that must outlive registration (handler UPP, hotkey ref, ...)
+_carbon_refs = []
+
+# The loaded Carbon library once a hotkey is registered through it. main()
+# checks this to decide which event pump to run: hotkey events sit in the
+# Carbon event queue and are only drained by RunApplicationEventLoop (or
+# another Carbon-aware dispatcher), not by a bare CFRunLoopRun.
+_carbon_lib = None
+
+def _register_carbon_hotkey(hotkey_str, callback):
+    """Register a global hotkey through Carbon's RegisterEventHotKey.
+
+    Unlike pynput's Quartz event tap, which sees (and pays a Python
+    round-trip for) every keystroke system-wide, RegisterEventHotKey makes
+    WindowServer deliver only the matching combo. Hotkey events are posted
+    to the Carbon event queue, which only RunApplicationEventLoop (or
+    another Carbon-aware dispatcher) on the main thread drains — a bare
+    CFRunLoopRun never dispatches them, so the caller must pump the right
+    loop (main() keys off _carbon_lib for this). Raises if the platform,
+    hotkey string, or registration doesn't cooperate.
+    """
+    if platform.system() != 'Darwin':
+        raise OSError("Carbon hotkeys are macOS-only")
+
+    carbon_path = ctypes.util.find_library('Carbon')
+    if carbon_path is None:
+        raise OSError("Carbon framework not found")
+    carbon = ctypes.CDLL(carbon_path)
+
+    modifiers = 0
+    keycode = None
+    for part in hotkey_str.lower().split('+'):
+        part = _KEY_ALIASES.get(part.strip(), part.strip())
+        if part in _CARBON_MODIFIERS:
+            modifiers |= _CARBON_MODIFIERS[part]
+        elif part in _CARBON_KEYCODES:
+            keycode = _CARBON_KEYCODES[part]
+        else:
+            raise ValueError(f"Unsupported hotkey token: {part!r}")
+    if keycode is None:
+        raise ValueError(f"No non-modifier key in hotkey: {hotkey_str!r}")
+
+    def _handler(call_ref, event_ref, user_data):
+        callback()
+        return 0  # noErr
+
+    handler_upp = _EVENT_HANDLER_TYPE(_handler)
+    spec = _EventTypeSpec(_kEventClassKeyboard, _kEventHotKeyPressed)
+
+    carbon.GetApplicationEventTarget.restype = ctypes.c_void_p
+    target = carbon.GetApplicationEventTarget()
+
+    err = carbon.InstallEventHandler(
+        ctypes.c_void_p(target), handler_upp, 1, ctypes.byref(spec),
+        None, None)
+    if err != 0:
+        raise OSError(f"InstallEventHandler failed (error {err})")
+
+    hotkey_id = _EventHotKeyID(int.from_bytes(b'ttcr', 'big'), 1)
+    hotkey_ref = ctypes.c_void_p()
+    carbon.RegisterEventHotKey.argtypes = [
+        ctypes.c_uint32, ctypes.c_uint32, _EventHotKeyID,
+        ctypes.c_void_p, ctypes.c_uint32, ctypes.POINTER(ctypes.c_void_p)]
+    err = carbon.RegisterEventHotKey(
+        keycode, modifiers, hotkey_id, target, 0, ctypes.byref(hotkey_ref))
+    if err != 0:
+        raise OSError(f"RegisterEventHotKey failed (error {err})")
+
+    _carbon_refs.extend([handler_upp, spec, hotkey_id, hotkey_ref])
+    global _carbon_lib
+    _carbon_lib = carbon
+    return hotkey_ref
+
+def setup_manual_trigger(main_runloop=False):
+    """Register a global hotkey to manually trigger the Wispr loop.
+
+    main_runloop says whether the caller will pump the main CFRunLoop;
+    Carbon hotkey events are only delivered on a serviced main event loop.
+    """
     if not WISPR_LOOP_ENABLED:
         return None
-    
+
+    def on_manual_trigger():
+        print(f"[wispr-loop] Manual trigger activated!")
+        threading.Thread(target=trigger_wispr_loop, daemon=True).start()
+
+    # Prefer Carbon: only the registered combo reaches us, instead of an
+    # event tap paying a Python callback for every keystroke system-wide.
+    # RegisterEventHotKey succeeds even when nothing will ever dispatch the
+    # events, so only attempt it when the main run loop is being pumped.
+    if main_runloop:
+        try:
+            return _register_carbon_hotkey(MANUAL_TRIGGER_HOTKEY,
+                                           on_manual_trigger)
+        except Exception as e:
+            print(f"[wispr-loop] Carbon hotkey unavailable ({e}), using pynput")
+
     # Convert hotkey string to format expected by GlobalHotKeys
     # e.g., "ctrl+shift+l" -> '<ctrl>+<shift>+l'
     parts = MANUAL_TRIGGER_HOTKEY.lower().split('+')
     formatted_parts = []
     for part in parts:
-        part = part.strip()
-        if part in ['shift', 'ctrl', 'control', 'alt', 'option', 'cmd', 'command']:
+        part = _KEY_ALIASES.get(part.strip(), part.strip())
+        if part in _KEY_MAP:
             formatted_parts.append(f'<{part}>')
         else:
             formatted_parts.append(part)
     formatted_hotkey = '+'.join(formatted_parts)
-    
-    def on_manual_trigger():
-        print(f"[wispr-loop] Manual trigger activated!")
-        threading.Thread(target=trigger_wispr_loop, daemon=True).start()
-    
+
     try:
         hotkeys = GlobalHotKeys({
             formatted_hotkey: on_manual_trigger
@@ -368,21 +993,89 @@ def main():
   Press Ctrl+C to stop.
 """)
 
-    # Start monitors in separate threads
+    global _reactor
+
+    observer_ok = False
     if AUTO_SUBMIT_ENABLED:
+        observer_ok = start_text_observer()
+        if observer_ok:
+            print("[auto-submit] AXObserver text monitor started")
+
+    if hasattr(select, 'kqueue'):
+        # One reactor instead of a sleeping thread per monitor: a kernel
+        # timer drives the AX poll fallback and a vnode watch (or FSEvents
+        # handing over via call_soon) drives the signal check. Hotkey
+        # callbacks do not go through the reactor — they spawn short-lived
+        # worker threads directly, since the Wispr loop blocks for seconds
+        # at a time. The reactor runs on a worker thread; the main
+        # thread must pump a CFRunLoop instead, because AppKit and Carbon
+        # event delivery (workspace notifications, hotkey events,
+        # NSRunningApplication state refresh) is serviced by the main run
+        # loop and starves if main just blocks in kq.control.
+        _reactor = Reactor()
+
+        if AUTO_SUBMIT_ENABLED and not observer_ok:
+            _reactor.add_timer(150, _poll_text_tick)
+            print("[auto-submit] Text field monitor started (polling fallback)")
+
+        if WISPR_LOOP_ENABLED:
+            if start_signal_observer():
+                print("[wispr-loop] FSEvents observer started")
+            else:
+                _reactor.watch_dir(
+                    os.path.dirname(os.path.realpath(SIGNAL_PATH)),
+                    _check_listen_signal)
+            print("[wispr-loop] Signal watcher started")
+
+            manual_hotkey = setup_manual_trigger(main_runloop=HAVE_AX_OBSERVER)
+            if manual_hotkey:
+                print(f"[wispr-loop] Manual trigger registered: {MANUAL_TRIGGER_HOTKEY}")
+
+            # Catch a signal that landed before we started watching
+            _check_listen_signal()
+
+        threading.Thread(target=_reactor.run, daemon=True).start()
+
+        try:
+            if _carbon_lib is not None:
+                # A Carbon hotkey was registered: its events sit in the
+                # Carbon event queue, which a bare CFRunLoopRun (all the
+                # console loop below pumps) never drains. Pump via
+                # RunApplicationEventLoop instead — it runs the main
+                # CFRunLoop internally, so AppKit delivery and
+                # NSRunningApplication freshness are preserved. It blocks
+                # in C where Python's SIGINT flag is never checked, so
+                # restore the default handler to keep Ctrl+C working.
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                _carbon_lib.RunApplicationEventLoop()
+            elif HAVE_AX_OBSERVER:
+                # Services the main run loop; installInterrupt turns Ctrl+C
+                # into a clean stop
+                AppHelper.runConsoleEventLoop(installInterrupt=True)
+            else:
+                while True:
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            print("\n[main] Stopped.")
+        return
+
+    # No kqueue (non-BSD dev box): fall back to one thread per monitor
+    if AUTO_SUBMIT_ENABLED and not observer_ok:
         text_monitor = threading.Thread(target=monitor_text_field, daemon=True)
         text_monitor.start()
-        print("[auto-submit] Text field monitor started")
-    
+        print("[auto-submit] Text field monitor started (polling fallback)")
+
     if WISPR_LOOP_ENABLED:
+        if start_signal_observer():
+            print("[wispr-loop] FSEvents observer started")
         signal_watcher = threading.Thread(target=watch_for_signals, daemon=True)
         signal_watcher.start()
         print("[wispr-loop] Signal watcher started")
-        
-        manual_hotkey = setup_manual_trigger()
+
+        manual_hotkey = setup_manual_trigger(main_runloop=False)
         if manual_hotkey:
             print(f"[wispr-loop] Manual trigger registered: {MANUAL_TRIGGER_HOTKEY}")
-    
+
     try:
         # Keep main thread alive
         while True:
@@ -12,45 +12,277 @@ State machine:
   TRAILING_SILENCE -> DONE (silence duration exceeded)
 """
 
+import math
 import numpy as np
 import sounddevice as sd
+import threading
 import time
 from enum import Enum
 
+# Numba JIT-compiles the per-sample state machine; without it the same
+# function runs as plain Python, which is still fast enough at ~15 chunks/s.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Full scale of the int16 samples PortAudio hands us; thresholds supplied by
+# callers are in the normalized [0, 1] float domain.
+INT16_FULL_SCALE = 32768.0
+
+# How much audio the state machine consumes per kernel call, at most
+BATCH_SECONDS = 0.25
+
 class State(Enum):
     IDLE = "idle"
     SPEECH = "speech"
     TRAILING_SILENCE = "trailing_silence"
     DONE = "done"
 
+# Integer state codes used inside the jitted kernel, mirroring State
+_SM_IDLE, _SM_SPEECH, _SM_TRAILING, _SM_DONE = 0, 1, 2, 3
+
+_STATE_FROM_CODE = {
+    _SM_IDLE: State.IDLE,
+    _SM_SPEECH: State.SPEECH,
+    _SM_TRAILING: State.TRAILING_SILENCE,
+    _SM_DONE: State.DONE,
+}
+
+# On trivially-silent chunks the sum-of-squares pass is skipped; every Nth
+# such chunk still computes it so the idle noise floor keeps adapting
+# downwards when the room gets quieter.
+_FLOOR_UPDATE_STRIDE = 8
+
+def _run_sm(samples, n_per_chunk, noise_floor_ms, min_floor_ms, snr_sq,
+            silence_chunks, state, silence_count, speech_detected,
+            floor_tick):
+    """Run the silence state machine over a batch of whole chunks.
+
+    samples is a flat int64 buffer holding samples.size // n_per_chunk
+    chunks. Speech is declared when a chunk's mean square exceeds the
+    noise-floor estimate times snr_sq (an SNR criterion rather than a
+    fixed threshold); the floor is an EWMA updated while IDLE and during
+    TRAILING silence — never while speech is above the criterion — so it
+    tracks the room without being dragged up by speech, and it is clamped
+    at min_floor_ms, which callers derive from the configured threshold
+    so the criterion can only adapt upwards from there.
+
+    Each chunk is first screened by its peak amplitude: since the mean
+    square can never exceed peak^2, a chunk whose peak is already below
+    the criterion is silent and skips the sum-of-squares pass entirely —
+    the dominant case for background audio. Silence is counted in chunks
+    (audio time), so the result does not depend on how the batch was
+    sliced. Returns the updated
+    (state, silence_count, speech_detected, noise_floor_ms, floor_tick)
+    tuple.
+    """
+    n_chunks = samples.size // n_per_chunk
+
+    for c in range(n_chunks):
+        base = c * n_per_chunk
+        criterion = noise_floor_ms * snr_sq
+
+        peak = 0
+        for i in range(base, base + n_per_chunk):
+            v = samples[i]
+            a = -v if v < 0 else v
+            if a > peak:
+                peak = a
+
+        if peak * peak <= criterion:
+            # Trivially silent: mean_sq <= peak^2 <= criterion
+            above = False
+            if state == _SM_IDLE or state == _SM_TRAILING:
+                floor_tick += 1
+                if floor_tick >= _FLOOR_UPDATE_STRIDE:
+                    floor_tick = 0
+                    sum_sq = 0
+                    for i in range(base, base + n_per_chunk):
+                        v = samples[i]
+                        sum_sq += v * v
+                    mean_sq = sum_sq / n_per_chunk
+                    noise_floor_ms = 0.95 * noise_floor_ms + 0.05 * mean_sq
+                    if noise_floor_ms < min_floor_ms:
+                        noise_floor_ms = min_floor_ms
+        else:
+            sum_sq = 0
+            for i in range(base, base + n_per_chunk):
+                v = samples[i]
+                sum_sq += v * v
+            mean_sq = sum_sq / n_per_chunk
+            above = mean_sq > criterion
+            if (state == _SM_IDLE or state == _SM_TRAILING) and not above:
+                # Track the ambient level whenever nobody is speaking, so a
+                # bad initial estimate can still recover during trailing
+                # silence
+                noise_floor_ms = 0.95 * noise_floor_ms + 0.05 * mean_sq
+                if noise_floor_ms < min_floor_ms:
+                    noise_floor_ms = min_floor_ms
+
+        if state == _SM_IDLE:
+            if above:
+                state = _SM_SPEECH
+                speech_detected = True
+        elif state == _SM_SPEECH:
+            if not above:
+                state = _SM_TRAILING
+                silence_count = 0
+        elif state == _SM_TRAILING:
+            if above:
+                state = _SM_SPEECH
+                silence_count = 0
+            else:
+                silence_count += 1
+                if silence_count >= silence_chunks:
+                    state = _SM_DONE
+                    break
+
+    return state, silence_count, speech_detected, noise_floor_ms, floor_tick
+
+if njit is not None:
+    _run_sm = njit(cache=True)(_run_sm)
+
 class SilenceDetector:
-    def __init__(self, 
+    def __init__(self,
                  silence_threshold=0.02,
                  silence_duration=2.0,
                  sample_rate=16000,
-                 chunk_size=1024):
+                 chunk_size=1024,
+                 barge_in_threshold=None,
+                 on_barge_in=None,
+                 snr_k=4.0):
         """
         Initialize the silence detector.
-        
+
         Args:
-            silence_threshold: RMS amplitude threshold for speech detection
+            silence_threshold: Minimum speech threshold (normalized RMS).
+                Seeds the adaptive noise floor, which can raise the
+                effective threshold above this in noisy rooms but never
+                lower it below
             silence_duration: Seconds of silence needed to confirm user stopped
             sample_rate: Audio sample rate in Hz
             chunk_size: Number of samples per chunk
+            barge_in_threshold: Optional peak amplitude (normalized, 0-1) above
+                which on_barge_in fires, e.g. to halt TTS playback when the
+                user talks over it
+            on_barge_in: Callback invoked once when barge_in_threshold is hit
+            snr_k: Speech is declared when chunk RMS exceeds the estimated
+                noise floor times this factor
         """
         self.silence_threshold = silence_threshold
         self.silence_duration = silence_duration
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
-        
+        self.on_barge_in = on_barge_in
+        self.snr_k = snr_k
+
+        # Noise-floor estimate, tracked in the int16 mean-square domain so
+        # the hot path never needs a sqrt. Hardcoded RMS thresholds are
+        # fragile across mics and rooms; instead an EWMA of the ambient
+        # level is kept while nobody is speaking and speech is declared on
+        # SNR. The floor is seeded and clamped at silence_threshold / snr_k,
+        # so the speech criterion starts at exactly the configured threshold
+        # and only ever adapts upwards from it in noisier rooms — ambient
+        # noise below the threshold can't fake a speech onset.
+        self._min_floor_ms = (silence_threshold / snr_k * INT16_FULL_SCALE) ** 2
+        self._noise_floor_ms = self._min_floor_ms
+        self._snr_sq = snr_k ** 2
+        self.noise_floor = math.sqrt(self._noise_floor_ms) / INT16_FULL_SCALE
+
+        # Silence duration counted in whole chunks of audio time: exact
+        # regardless of wall-clock behaviour or how batches are sliced
+        self._silence_chunks = max(1, math.ceil(
+            silence_duration * sample_rate / chunk_size))
+        if barge_in_threshold is not None:
+            self._barge_in_peak = int(barge_in_threshold * INT16_FULL_SCALE)
+        else:
+            self._barge_in_peak = None
+
+        # One second of int16 ring buffer filled by the PortAudio callback;
+        # the state machine consumes fixed chunks from it so audio capture
+        # never blocks on Python-side processing
+        self._ring = np.zeros(sample_rate, dtype=np.int16)
+        self._widx = 0
+        self._ridx = 0
+        self._available = 0
+        self._ring_lock = threading.Lock()
+        self._data_ready = threading.Event()
+
+        # Reused int64 batch buffer: up to BATCH_SECONDS worth of chunks are
+        # popped from the ring per kernel call, widened on copy so the hot
+        # path allocates nothing
+        self._batch_chunks = max(1, int(BATCH_SECONDS * sample_rate / chunk_size))
+        self._batch_buf = np.empty(self._batch_chunks * chunk_size,
+                                   dtype=np.int64)
+
         self.state = State.IDLE
-        self.silence_start_time = None
         self.speech_detected = False
-        
+
+    def _audio_callback(self, indata, frames, time_info, status):
+        """PortAudio callback: copy captured samples into the ring buffer."""
+        if status:
+            print(f"[silence-detector] Warning: {status}")
+
+        samples = indata.ravel()
+        n = len(samples)
+        ring_size = len(self._ring)
+
+        with self._ring_lock:
+            end = self._widx + n
+            if end <= ring_size:
+                self._ring[self._widx:end] = samples
+            else:
+                first = ring_size - self._widx
+                self._ring[self._widx:] = samples[:first]
+                self._ring[:end - ring_size] = samples[first:]
+            self._widx = end % ring_size
+            self._available += n
+            if self._available > ring_size:
+                # Overrun: drop the oldest samples
+                dropped = self._available - ring_size
+                self._ridx = (self._ridx + dropped) % ring_size
+                self._available = ring_size
+        self._data_ready.set()
+
+    def _read_batch(self, timeout=1.0):
+        """Pop whole chunks into the reusable batch buffer.
+
+        Takes as many complete chunks as are currently buffered, up to
+        _batch_chunks, so the kernel processes batches under load without
+        adding latency when audio trickles in. Returns the number of chunks
+        copied into _batch_buf (0 on timeout).
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._ring_lock:
+                if self._available >= self.chunk_size:
+                    n_chunks = min(self._available // self.chunk_size,
+                                   self._batch_chunks)
+                    n = n_chunks * self.chunk_size
+                    ring_size = len(self._ring)
+                    buf = self._batch_buf
+                    end = self._ridx + n
+                    if end <= ring_size:
+                        buf[:n] = self._ring[self._ridx:end]
+                    else:
+                        first = ring_size - self._ridx
+                        buf[:first] = self._ring[self._ridx:]
+                        buf[first:n] = self._ring[:end - ring_size]
+                    self._ridx = end % ring_size
+                    self._available -= n
+                    return n_chunks
+                self._data_ready.clear()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return 0
+            self._data_ready.wait(remaining)
+
     def compute_rms(self, audio_chunk):
-        """Compute the RMS (root mean square) of an audio chunk."""
-        return np.sqrt(np.mean(audio_chunk ** 2))
-    
+        """Compute the normalized RMS of an int16 audio chunk."""
+        x = audio_chunk.ravel().astype(np.int64)
+        return math.sqrt(np.dot(x, x) / x.size) / INT16_FULL_SCALE
+
     def wait_for_silence(self, verbose=True):
         """
         Monitor the microphone and wait for silence after detecting speech.
@@ -59,53 +291,65 @@ class SilenceDetector:
         """
         if verbose:
             print(f"[silence-detector] Listening for speech...")
-            print(f"[silence-detector] Threshold: {self.silence_threshold:.4f}, Silence duration: {self.silence_duration}s")
+            print(f"[silence-detector] SNR factor: {self.snr_k:.1f}, Silence duration: {self.silence_duration}s")
         
-        # Open the microphone stream
-        with sd.InputStream(samplerate=self.sample_rate, 
-                           channels=1, 
-                           blocksize=self.chunk_size) as stream:
-            
-            while self.state != State.DONE:
-                # Read audio chunk
-                audio_data, overflowed = stream.read(self.chunk_size)
-                
-                if overflowed:
-                    print("[silence-detector] Warning: Audio buffer overflow")
-                
-                # Compute RMS amplitude
-                rms = self.compute_rms(audio_data.flatten())
-                
-                # State machine transitions
-                if self.state == State.IDLE:
-                    if rms > self.silence_threshold:
-                        self.state = State.SPEECH
-                        self.speech_detected = True
-                        if verbose:
-                            print(f"[silence-detector] Speech detected (RMS: {rms:.4f})")
-                
-                elif self.state == State.SPEECH:
-                    if rms < self.silence_threshold:
-                        self.state = State.TRAILING_SILENCE
-                        self.silence_start_time = time.time()
-                        if verbose:
-                            print(f"[silence-detector] Trailing silence started...")
-                    # else: still speaking, remain in SPEECH state
-                
-                elif self.state == State.TRAILING_SILENCE:
-                    if rms > self.silence_threshold:
-                        # User started speaking again
-                        self.state = State.SPEECH
-                        self.silence_start_time = None
-                        if verbose:
-                            print(f"[silence-detector] Speech resumed (RMS: {rms:.4f})")
-                    else:
-                        # Check if silence duration exceeded
-                        elapsed = time.time() - self.silence_start_time
-                        if elapsed >= self.silence_duration:
-                            self.state = State.DONE
-                            if verbose:
-                                print(f"[silence-detector] Silence confirmed ({elapsed:.1f}s)")
+        # Open the microphone stream; int16 keeps the per-chunk math in
+        # integer domain and halves the bytes touched vs float32. The
+        # callback fills the ring buffer so capture never blocks on us.
+        with sd.InputStream(samplerate=self.sample_rate,
+                           channels=1,
+                           dtype='int16',
+                           blocksize=self.chunk_size,
+                           callback=self._audio_callback):
+
+            barge_in_fired = False
+            state = _SM_IDLE
+            silence_count = 0
+            speech_detected = False
+            floor_tick = 0
+
+            while state != _SM_DONE:
+                # Pop up to BATCH_SECONDS worth of chunks from the ring
+                n_chunks = self._read_batch()
+                if n_chunks == 0:
+                    continue
+                batch = self._batch_buf[:n_chunks * self.chunk_size]
+
+                # Barge-in: the user talking over TTS playback (peak taken
+                # from min/max rather than np.abs to avoid a temp array)
+                if (self._barge_in_peak is not None and not barge_in_fired
+                        and max(int(batch.max()), -int(batch.min()))
+                            > self._barge_in_peak):
+                    barge_in_fired = True
+                    if verbose:
+                        print(f"[silence-detector] Barge-in detected")
+                    if self.on_barge_in is not None:
+                        self.on_barge_in()
+
+                # Run the whole batch through the (JIT-compiled) state
+                # machine kernel in one call
+                prev_state = state
+                (state, silence_count, speech_detected,
+                 self._noise_floor_ms, floor_tick) = _run_sm(
+                    batch, self.chunk_size, self._noise_floor_ms,
+                    self._min_floor_ms, self._snr_sq,
+                    self._silence_chunks, state, silence_count,
+                    speech_detected, floor_tick,
+                )
+                self.noise_floor = (math.sqrt(self._noise_floor_ms)
+                                    / INT16_FULL_SCALE)
+                self.state = _STATE_FROM_CODE[state]
+                if speech_detected:
+                    self.speech_detected = True
+
+                if verbose and state != prev_state:
+                    if state == _SM_SPEECH:
+                        print(f"[silence-detector] Speech detected")
+                    elif state == _SM_TRAILING:
+                        print(f"[silence-detector] Trailing silence started...")
+                    elif state == _SM_DONE:
+                        print(f"[silence-detector] Silence confirmed "
+                              f"({self.silence_duration:.1f}s)")
         
         if verbose:
             print("[silence-detector] Done")
@@ -5,7 +5,7 @@ import { StdioServerTransport } from "@modelcontextprotocol/sdk/server/stdio.js"
 import { z } from "zod";
 import { ElevenLabsClient, play } from "@elevenlabs/elevenlabs-js";
 import { getEffectiveConfig } from "./config.js";
-import { writeFileSync } from "fs";
+import { writeFileSync, renameSync } from "fs";
 import { join, dirname } from "path";
 import { fileURLToPath } from "url";
 
@@ -66,13 +66,19 @@ async function processTTSQueue() {
       // Play and WAIT for audio to complete
       await play(audio);
 
-      // Write TTS completion signal for background script
+      // Write TTS completion signal for background script. The seq token
+      // lets the reader tell a fresh signal from a stale one without having
+      // to delete the file first, and the write-then-rename makes the update
+      // atomic so the reader never sees a partial JSON.
       const completionPath = join(__dirname, "..", "tts-complete.json");
       const completionSignal = {
         timestamp: new Date().toISOString(),
         completed: true,
+        seq: Date.now(),
       };
-      writeFileSync(completionPath, JSON.stringify(completionSignal, null, 2), "utf-8");
+      const tmpPath = `${completionPath}.tmp`;
+      writeFileSync(tmpPath, JSON.stringify(completionSignal, null, 2), "utf-8");
+      renameSync(tmpPath, completionPath);
       console.error(`[TTS] Playback complete, signal written: ${completionPath}`);
 
       item.resolve({